@@ -4,6 +4,10 @@ from bs4 import BeautifulSoup
 from ddgs import DDGS
 import time
 import random
+import queue
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import re
 
@@ -20,15 +24,282 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
+DNS_TTL = 300                # Seconds a successful lookup is reused
+DNS_NEGATIVE_TTL = 60        # Seconds a non-existent host stays marked dead
+LOOKAHEAD_COMPANIES = 3      # Upcoming companies searched and resolved in the background
+LOOKAHEAD_WORKERS = 4
+# Also open a TCP/TLS connection to upcoming hosts (no HTTP request is sent).
+# Still makes an extra connection per host, so it is off by default.
+PREWARM_CONNECTIONS = False
+PREWARM_TIMEOUT = 5          # Connect/TLS timeout for prewarmed connections
+
+# Shared ATS hosts, resolved once at startup
+ATS_HOSTS = [
+    "https://jobs.lever.co", "https://boards.greenhouse.io", "https://job-boards.greenhouse.io",
+    "https://apply.workable.com", "https://jobs.ashbyhq.com",
+]
+
+# Session used by the main loop; prewarmed connections land in its pool
+SESSION = requests.Session()
+
+# ================= DNS CACHE & LOOK-AHEAD =================
+
+# getaddrinfo errors meaning "this name does not exist" - only these are cached
+DEAD_HOST_ERRNOS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+def url_host_port(url):
+    """Returns (host, port) for a URL, or (None, None) if it has no host"""
+    if not url or not isinstance(url, str):
+        return None, None
+    try:
+        parsed = urlparse(url if "://" in url else f"https://{url}")
+        host = parsed.hostname
+        port = parsed.port or (80 if parsed.scheme == "http" else 443)
+    except ValueError:
+        return None, None
+    return (host.lower(), port) if host else (None, None)
+
+def uses_proxy(url):
+    """True if requests would send this URL through an environment proxy"""
+    return bool(requests.utils.select_proxy(url, requests.utils.get_environ_proxies(url)))
+
+class DNSCache:
+    """
+    Thread-safe getaddrinfo cache with a TTL per entry.
+
+    Hosts that do not exist (EAI_NONAME / EAI_NODATA) are cached for
+    DNS_NEGATIVE_TTL so they are skipped before any HTTP attempt; temporary
+    failures are re-raised without being cached. Concurrent lookups of the
+    same host share a single resolver call. `resolver` has the
+    socket.getaddrinfo signature and can be a stub for offline testing;
+    `clock` can be swapped to exercise expiry and `event_factory` to
+    observe threads waiting on an in-flight lookup.
+    """
+
+    def __init__(self, resolver=None, ttl=DNS_TTL, negative_ttl=DNS_NEGATIVE_TTL, clock=time.monotonic,
+                 event_factory=threading.Event):
+        self.resolver = resolver or socket.getaddrinfo
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.event_factory = event_factory
+        self.stats = {"hits": 0, "misses": 0, "dead": 0}
+        self._entries = {}   # key -> (expires_at, addrinfo list or None, errno)
+        self._pending = {}   # key -> threading.Event for in-flight lookups
+        self._lock = threading.Lock()
+        self._original_getaddrinfo = None
+
+    def lookup(self, host, port=443, family=0, type=socket.SOCK_STREAM):
+        """Returns cached getaddrinfo results, raising socket.gaierror for dead hosts"""
+        key = (host.lower(), port, family, type)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry and entry[0] > self.clock():
+                    self.stats["hits"] += 1
+                    if entry[1] is None:
+                        raise socket.gaierror(entry[2], f"{host} is marked dead")
+                    return entry[1]
+                event = self._pending.get(key)
+                if event is None:
+                    event = self._pending[key] = self.event_factory()
+                    self.stats["misses"] += 1
+                    break
+            # Another thread is resolving this host - wait for its result
+            event.wait()
+
+        try:
+            result = self.resolver(host, port, family, type)
+        except socket.gaierror as e:
+            if e.errno in DEAD_HOST_ERRNOS:
+                with self._lock:
+                    self._entries[key] = (self.clock() + self.negative_ttl, None, e.errno)
+                    self.stats["dead"] += 1
+            raise
+        else:
+            # Store before waking waiters so they find the entry
+            with self._lock:
+                self._entries[key] = (self.clock() + self.ttl, result, None)
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    def is_alive(self, url):
+        """
+        Returns False only if the URL has no host or its host does not exist.
+        Proxied URLs and temporary DNS failures are left to the HTTP request.
+        """
+        host, port = url_host_port(url)
+        if not host:
+            return False
+        if uses_proxy(url):
+            return True
+        try:
+            self.lookup(host, port)
+        except socket.gaierror as e:
+            return e.errno not in DEAD_HOST_ERRNOS
+        except UnicodeError:
+            return False
+        return True
+
+    def _getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        # Only plain TCP lookups (what urllib3 does) go through the cache
+        if proto or flags or type != socket.SOCK_STREAM or not isinstance(host, str) or not isinstance(port, int):
+            return self._original_getaddrinfo(host, port, family, type, proto, flags)
+        return self.lookup(host, port, family, type)
+
+    def install(self):
+        """Routes socket.getaddrinfo through the cache so requests reuses cached lookups"""
+        if self._original_getaddrinfo is None:
+            self._original_getaddrinfo = socket.getaddrinfo
+            socket.getaddrinfo = self._getaddrinfo
+
+    def uninstall(self):
+        if self._original_getaddrinfo is not None:
+            socket.getaddrinfo = self._original_getaddrinfo
+            self._original_getaddrinfo = None
+
+class HostPrefetcher:
+    """
+    Resolves hosts in background threads while the current company is being
+    scraped. With `prewarm`, also opens a connection in the session's urllib3
+    pool (thread-safe, unlike the Session itself) without sending a request.
+    """
+
+    def __init__(self, cache, session=None, workers=LOOKAHEAD_WORKERS, prewarm=PREWARM_CONNECTIONS):
+        self.cache = cache
+        self.session = session
+        self.prewarm = prewarm and session is not None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dns-lookahead")
+        self._futures = {}   # (host, port) -> Future
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def schedule(self, urls):
+        """
+        Queues lookups for every new host in `urls`; already in-flight hosts are
+        skipped. Called from both the main and search-ahead threads, and a no-op
+        after shutdown().
+        """
+        with self._lock:
+            if self._closed:
+                return
+            for url in urls:
+                host, port = url_host_port(url)
+                if not host or uses_proxy(url):
+                    continue
+                future = self._futures.get((host, port))
+                if future is not None and not future.done():
+                    continue
+                self._futures[(host, port)] = self._executor.submit(self._warm, host, port)
+
+    def _warm(self, host, port):
+        try:
+            self.cache.lookup(host, port)
+        except (OSError, UnicodeError):
+            return False
+        if self.prewarm:
+            scheme = "http" if port == 80 else "https"
+            self._connect(f"{scheme}://{host}:{port}/")
+        return True
+
+    def _connect(self, url):
+        try:
+            adapter = self.session.get_adapter(url)
+            # Same pool lookup Session.send uses (requests >= 2.32 / older)
+            if hasattr(adapter, "get_connection_with_tls_context"):
+                settings = self.session.merge_environment_settings(url, {}, None, None, None)
+                request = requests.Request("GET", url).prepare()
+                pool = adapter.get_connection_with_tls_context(request, verify=settings["verify"], cert=settings["cert"])
+            else:
+                pool = adapter.get_connection(url)
+            # urllib3 has no public "open a connection" call; _get_conn/_put_conn
+            # are checked against urllib3 1.26 (requests 2.31) and 2.x
+            conn = pool._get_conn()
+        except Exception:
+            return
+        # Pool connections have no timeout until a request sets one, so bound
+        # the TCP connect and TLS handshake here
+        conn.timeout = PREWARM_TIMEOUT
+        try:
+            conn.connect()
+        except Exception:
+            conn.close()
+        pool._put_conn(conn)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+class SearchAhead:
+    """
+    Runs google_dork_search for upcoming companies on a single background
+    thread and resolves the hosts it finds, so the main loop usually gets
+    search results and warm DNS entries without waiting. Searches stay
+    sequential with the usual delay between companies, and use their own
+    Session so the main loop's Session is never shared across threads.
+
+    The thread is a daemon: after shutdown() no new search starts, and a
+    search already running is abandoned when the script exits.
+    """
+
+    def __init__(self, prefetcher, delay=(3, 6)):
+        self.prefetcher = prefetcher
+        self.delay = delay
+        self.session = requests.Session()
+        self._next_search_at = 0.0
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._futures = {}   # row index -> Future of search_data
+        self._thread = threading.Thread(target=self._run, name="search-ahead", daemon=True)
+        self._thread.start()
+
+    def schedule(self, index, company):
+        if index not in self._futures and not self._stop.is_set():
+            future = self._futures[index] = Future()
+            self._queue.put((future, company))
+
+    def _run(self):
+        while True:
+            future, company = self._queue.get()
+            # Keep the usual spacing between companies' searches; wakes early on shutdown
+            self._stop.wait(max(0.0, self._next_search_at - time.monotonic()))
+            if self._stop.is_set():
+                future.cancel()
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                data = google_dork_search(company, session=self.session)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            self._next_search_at = time.monotonic() + random.uniform(*self.delay)
+            self.prefetcher.schedule([data['website'], data['careers_url'], data['job_listings_url']])
+            future.set_result(data)
+
+    def result(self, index, company):
+        """Search data for `company`, scheduling it now if the look-ahead has not"""
+        self.schedule(index, company)
+        return self._futures.pop(index).result()
+
+    def shutdown(self):
+        self._stop.set()
+
+DNS_CACHE = DNSCache()
+
 # ================= PART 1: SEARCH & ENRICHMENT =================
 
-def find_careers_on_website(website_url):
+def find_careers_on_website(website_url, session=SESSION):
     """Try to find careers page by scraping the company website"""
-    if not website_url:
+    if not website_url or not DNS_CACHE.is_alive(website_url):
         return None
     
     try:
-        resp = requests.get(website_url, headers=HEADERS, timeout=8)
+        resp = session.get(website_url, headers=HEADERS, timeout=8)
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.text, 'html.parser')
             
@@ -47,7 +318,7 @@ def find_careers_on_website(website_url):
     
     return None
 
-def google_dork_search(company_name):
+def google_dork_search(company_name, session=SESSION):
     """
     Uses DuckDuckGo to find the Official Site, LinkedIn, and Careers Page.
     Returns a dictionary of URLs.
@@ -113,7 +384,7 @@ def google_dork_search(company_name):
         
         # 3. Try to find careers page on the website directly
         if data['website'] and not data['careers_url']:
-            careers_from_site = find_careers_on_website(data['website'])
+            careers_from_site = find_careers_on_website(data['website'], session=session)
             if careers_from_site:
                 data['careers_url'] = careers_from_site
                 # Check if it's an ATS platform
@@ -414,8 +685,11 @@ def get_job_description(url):
     """
     Visits the specific job page to get the description text.
     """
+    if not DNS_CACHE.is_alive(url):
+        return "Description unavailable"
+    
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=8)
+        resp = SESSION.get(url, headers=HEADERS, timeout=8)
         if resp.status_code == 200:
             # Check if response is HTML
             content_type = resp.headers.get('Content-Type', '').lower()
@@ -448,6 +722,17 @@ def get_job_description(url):
 
 # ================= PART 3: MAIN EXECUTION =================
 
+def upcoming_companies(df, index, count=LOOKAHEAD_COMPANIES):
+    """(index, company, known URLs) for the current row and the next `count` that still need scraping"""
+    upcoming = []
+    for idx, row in df.loc[index:index + count].iterrows():
+        company = str(row['Company Name']).strip()
+        if not company or company == 'nan' or pd.notna(row.get('job post1 URL')):
+            continue
+        urls = [str(row[col]) for col in ('Website URL', 'Careers Page URL', 'Job listings page URL') if pd.notna(row.get(col))]
+        upcoming.append((idx, company, urls))
+    return upcoming
+
 def main():
     print(f"📂 Reading {INPUT_FILE}...")
     try:
@@ -465,146 +750,176 @@ def main():
         'job post2 URL', 'job post2 title', 'job post2 location', 'job post2 description',
         'job post3 URL', 'job post3 title', 'job post3 location', 'job post3 description'
     ]
-    
+        
     for col in required_cols:
         if col not in df.columns:
             df[col] = None
 
     total_jobs_found = 0
     companies_processed = 0
-    
+        
+    DNS_CACHE.install()
+    prefetcher = HostPrefetcher(DNS_CACHE, session=SESSION)
+    prefetcher.schedule(ATS_HOSTS)
+    search_ahead = SearchAhead(prefetcher)
+        
     print("🚀 Starting Web Scraping (No AI, pure web scraping)...\n")
     print("=" * 80)
 
-    for index, row in df.iterrows():
-        # Skip already processed companies (start from index 60)
-        if index < 60:
-            continue
-        if total_jobs_found >= TARGET_TOTAL_JOBS:
-            print(f"\n🎉 TARGET REACHED! Found {total_jobs_found} jobs across {companies_processed} companies!")
-            break
-
-        company = str(row['Company Name']).strip()
-        if not company or company == 'nan':
-            continue
+    try:
+        for index, row in df.iterrows():
+            # Skip already processed companies (start from index 60)
+            if index < 60:
+                continue
+            if total_jobs_found >= TARGET_TOTAL_JOBS:
+                print(f"\n🎉 TARGET REACHED! Found {total_jobs_found} jobs across {companies_processed} companies!")
+                break
 
-        print(f"\n[{index+1}/{len(df)}] 🏢 {company}")
-        companies_processed += 1
+            company = str(row['Company Name']).strip()
+            if not company or company == 'nan':
+                continue
 
-        # Skip if already has data
-        if pd.notna(row.get('job post1 URL')):
-            print("   ⏭️  Already has job data, skipping...")
-            # Count existing jobs
-            for i in range(1, 4):
-                if pd.notna(row.get(f'job post{i} URL')):
-                    total_jobs_found += 1
-            continue
+            print(f"\n[{index+1}/{len(df)}] 🏢 {company}")
+            companies_processed += 1
+            
+            # Search and resolve hosts of the next companies while this one is scraped.
+            # The current row is listed first so its search is never queued behind them.
+            for next_index, next_company, known_urls in upcoming_companies(df, index):
+                prefetcher.schedule(known_urls)
+                search_ahead.schedule(next_index, next_company)
 
-        # --- STEP 1: ENRICHMENT (Search) ---
-        print("   🔍 Searching for company URLs...")
-        search_data = google_dork_search(company)
-        
-        # Save enrichment data
-        if search_data['website']:
-            df.at[index, 'Website URL'] = search_data['website']
-            print(f"   ✓ Website: {search_data['website'][:60]}")
-        
-        if search_data['linkedin']:
-            df.at[index, 'Linkedin URL'] = search_data['linkedin']
-            print(f"   ✓ LinkedIn: {search_data['linkedin'][:60]}")
-        
-        if search_data['careers_url']:
-            df.at[index, 'Careers Page URL'] = search_data['careers_url']
-            print(f"   ✓ Careers: {search_data['careers_url'][:60]}")
-        
-        job_board_url = search_data['job_listings_url'] or search_data['careers_url']
-        if job_board_url:
-            df.at[index, 'Job listings page URL'] = job_board_url
-
-        # --- STEP 2: SCRAPING JOBS ---
-        if not job_board_url:
-            print("   ⚠️  No careers/jobs page found")
-            time.sleep(random.uniform(1, 2))
-            continue
+            # Skip if already has data
+            if pd.notna(row.get('job post1 URL')):
+                print("   ⏭️  Already has job data, skipping...")
+                # Count existing jobs
+                for i in range(1, 4):
+                    if pd.notna(row.get(f'job post{i} URL')):
+                        total_jobs_found += 1
+                continue
 
-        print(f"   🕷️  Scraping jobs from: {job_board_url[:60]}...")
-        
-        try:
-            resp = requests.get(job_board_url, headers=HEADERS, timeout=12)
+            # --- STEP 1: ENRICHMENT (Search) ---
+            print("   🔍 Searching for company URLs...")
+            search_data = search_ahead.result(index, company)
             
-            if resp.status_code != 200:
-                print(f"   ❌ HTTP {resp.status_code}")
-                time.sleep(random.uniform(2, 3))
-                continue
+            # Save enrichment data
+            if search_data['website']:
+                df.at[index, 'Website URL'] = search_data['website']
+                print(f"   ✓ Website: {search_data['website'][:60]}")
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            found_jobs = []
+            if search_data['linkedin']:
+                df.at[index, 'Linkedin URL'] = search_data['linkedin']
+                print(f"   ✓ LinkedIn: {search_data['linkedin'][:60]}")
             
-            # Detect ATS and use specific scraper
-            url_lower = job_board_url.lower()
+            if search_data['careers_url']:
+                df.at[index, 'Careers Page URL'] = search_data['careers_url']
+                print(f"   ✓ Careers: {search_data['careers_url'][:60]}")
             
-            if "lever.co" in url_lower:
-                print("   🎯 Detected: Lever")
-                found_jobs = scrape_lever(soup, job_board_url)
-            elif "greenhouse.io" in url_lower or "greenhouse.com" in url_lower:
-                print("   🎯 Detected: Greenhouse")
-                found_jobs = scrape_greenhouse(soup, job_board_url)
-            elif "zohorecruit.com" in url_lower or "zoho" in url_lower:
-                print("   🎯 Detected: Zoho Recruit")
-                found_jobs = scrape_generic_careers(soup, job_board_url)
-            elif "personio" in url_lower:
-                print("   🎯 Detected: Personio")
-                found_jobs = scrape_personio(soup, job_board_url)
-            elif "teamtailor" in url_lower:
-                print("   🎯 Detected: Teamtailor")
-                found_jobs = scrape_teamtailor(soup, job_board_url)
-            elif "workable.com" in url_lower:
-                print("   🎯 Detected: Workable")
-                found_jobs = scrape_generic_careers(soup, job_board_url)
-            elif "ashbyhq.com" in url_lower:
-                print("   🎯 Detected: Ashby")
-                found_jobs = scrape_generic_careers(soup, job_board_url)
-            else:
-                print("   🎯 Using: Generic scraper")
-                found_jobs = scrape_generic_careers(soup, job_board_url)
+            job_board_url = search_data['job_listings_url'] or search_data['careers_url']
+            if job_board_url:
+                df.at[index, 'Job listings page URL'] = job_board_url
+                prefetcher.schedule([job_board_url])
+
+            # --- STEP 2: SCRAPING JOBS ---
+            if not job_board_url:
+                print("   ⚠️  No careers/jobs page found")
+                time.sleep(random.uniform(1, 2))
+                continue
 
-            # --- STEP 3: FILL EXCEL & GET DESCRIPTIONS ---
-            if not found_jobs:
-                print("   ⚠️  No jobs found on page")
+            if not url_host_port(job_board_url)[0]:
+                print("   ⚠️  Job board URL has no host")
+                time.sleep(random.uniform(1, 2))
+                continue
             
-            for i, job in enumerate(found_jobs):
-                if i >= 3:
-                    break
+            if not DNS_CACHE.is_alive(job_board_url):
+                print("   ☠️  Job board host does not exist (DNS), skipping")
+                time.sleep(random.uniform(1, 2))
+                continue
+
+            print(f"   🕷️  Scraping jobs from: {job_board_url[:60]}...")
+            
+            try:
+                resp = SESSION.get(job_board_url, headers=HEADERS, timeout=12)
                 
-                job_num = i + 1
+                if resp.status_code != 200:
+                    print(f"   ❌ HTTP {resp.status_code}")
+                    time.sleep(random.uniform(2, 3))
+                    continue
                 
-                # Save job data
-                df.at[index, f'job post{job_num} title'] = job['title']
-                df.at[index, f'job post{job_num} URL'] = job['url']
-                df.at[index, f'job post{job_num} location'] = job['location']
+                soup = BeautifulSoup(resp.text, 'html.parser')
+                found_jobs = []
                 
-                print(f"      ✅ Job {job_num}: {job['title'][:50]}")
+                # Detect ATS and use specific scraper
+                url_lower = job_board_url.lower()
                 
-                # Get description (with delay)
-                time.sleep(random.uniform(1, 2))
-                desc = get_job_description(job['url'])
-                df.at[index, f'job post{job_num} description'] = desc
+                if "lever.co" in url_lower:
+                    print("   🎯 Detected: Lever")
+                    found_jobs = scrape_lever(soup, job_board_url)
+                elif "greenhouse.io" in url_lower or "greenhouse.com" in url_lower:
+                    print("   🎯 Detected: Greenhouse")
+                    found_jobs = scrape_greenhouse(soup, job_board_url)
+                elif "zohorecruit.com" in url_lower or "zoho" in url_lower:
+                    print("   🎯 Detected: Zoho Recruit")
+                    found_jobs = scrape_generic_careers(soup, job_board_url)
+                elif "personio" in url_lower:
+                    print("   🎯 Detected: Personio")
+                    found_jobs = scrape_personio(soup, job_board_url)
+                elif "teamtailor" in url_lower:
+                    print("   🎯 Detected: Teamtailor")
+                    found_jobs = scrape_teamtailor(soup, job_board_url)
+                elif "workable.com" in url_lower:
+                    print("   🎯 Detected: Workable")
+                    found_jobs = scrape_generic_careers(soup, job_board_url)
+                elif "ashbyhq.com" in url_lower:
+                    print("   🎯 Detected: Ashby")
+                    found_jobs = scrape_generic_careers(soup, job_board_url)
+                else:
+                    print("   🎯 Using: Generic scraper")
+                    found_jobs = scrape_generic_careers(soup, job_board_url)
+
+                # --- STEP 3: FILL EXCEL & GET DESCRIPTIONS ---
+                if not found_jobs:
+                    print("   ⚠️  No jobs found on page")
                 
-                total_jobs_found += 1
+                # Resolve job page hosts during the delay before each description fetch
+                prefetcher.schedule(job['url'] for job in found_jobs[:3])
                 
-                if total_jobs_found >= TARGET_TOTAL_JOBS:
-                    break
+                for i, job in enumerate(found_jobs):
+                    if i >= 3:
+                        break
+                    
+                    job_num = i + 1
+                    
+                    # Save job data
+                    df.at[index, f'job post{job_num} title'] = job['title']
+                    df.at[index, f'job post{job_num} URL'] = job['url']
+                    df.at[index, f'job post{job_num} location'] = job['location']
+                    
+                    print(f"      ✅ Job {job_num}: {job['title'][:50]}")
+                    
+                    # Get description (with delay)
+                    time.sleep(random.uniform(1, 2))
+                    desc = get_job_description(job['url'])
+                    df.at[index, f'job post{job_num} description'] = desc
+                    
+                    total_jobs_found += 1
+                    
+                    if total_jobs_found >= TARGET_TOTAL_JOBS:
+                        break
 
-        except Exception as e:
-            print(f"   ❌ Scraping error: {e}")
-        
-        # Save progress every 5 companies
-        if index % 5 == 0:
-            df.to_excel(OUTPUT_FILE, index=False)
-            print(f"\n💾 Progress saved ({total_jobs_found} jobs so far)")
-        
-        # Respectful delay between companies
-        time.sleep(random.uniform(3, 6))
+            except Exception as e:
+                print(f"   ❌ Scraping error: {e}")
+            
+            # Save progress every 5 companies
+            if index % 5 == 0:
+                df.to_excel(OUTPUT_FILE, index=False)
+                print(f"\n💾 Progress saved ({total_jobs_found} jobs so far)")
+            
+            # Respectful delay between companies
+            time.sleep(random.uniform(3, 6))
+    finally:
+        search_ahead.shutdown()
+        prefetcher.shutdown()
+        DNS_CACHE.uninstall()
 
     # Final save
     df.to_excel(OUTPUT_FILE, index=False)
@@ -612,6 +927,7 @@ def main():
     print(f"✅ COMPLETE!")
     print(f"📊 Total jobs found: {total_jobs_found}")
     print(f"🏢 Companies processed: {companies_processed}")
+    print(f"🌐 DNS cache: {DNS_CACHE.stats['hits']} hits, {DNS_CACHE.stats['misses']} lookups, {DNS_CACHE.stats['dead']} dead hosts")
     print(f"💾 Saved to: {OUTPUT_FILE}")
     print("=" * 80)
 
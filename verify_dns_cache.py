@@ -0,0 +1,130 @@
+"""
+Offline check of the DNS cache in scraper.py using a stub resolver and a fake clock
+"""
+import os
+import socket
+import threading
+
+import scraper
+from scraper import DNSCache
+
+print("🔍 Verifying DNS cache (offline, stub resolver)...\n")
+
+# Ignore proxies from the environment; the proxy bypass is checked separately below
+real_uses_proxy = scraper.uses_proxy
+scraper.uses_proxy = lambda url: False
+
+ADDR = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', 443))]
+calls = []
+now = [0.0]
+events = []
+
+class CountingEvent(threading.Event):
+    """Counts threads waiting on an in-flight lookup; set() returns once they have all woken"""
+
+    def __init__(self):
+        super().__init__()
+        self.waiting = 0
+        self.cond = threading.Condition()
+        events.append(self)
+
+    def wait(self, timeout=None):
+        with self.cond:
+            self.waiting += 1
+            self.cond.notify_all()
+        result = super().wait(timeout)
+        with self.cond:
+            self.waiting -= 1
+            self.cond.notify_all()
+        return result
+
+    def set(self):
+        super().set()
+        with self.cond:
+            self.cond.wait_for(lambda: self.waiting == 0, timeout=5)
+
+def stub_resolver(host, port, family, type):
+    calls.append(host)
+    if host == "shared.example" and calls.count(host) == 1:
+        # Hold the first lookup until the other 4 threads are waiting on it
+        event = events[-1]
+        with event.cond:
+            assert event.cond.wait_for(lambda: event.waiting == 4, timeout=5), "threads did not overlap"
+    if host == "dead.example":
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    if host == "flaky.example":
+        raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+    return ADDR
+
+cache = DNSCache(resolver=stub_resolver, ttl=10, negative_ttl=5, clock=lambda: now[0],
+                 event_factory=CountingEvent)
+
+# 1. Miss then hit
+assert cache.lookup("ok.example") == ADDR
+assert cache.lookup("OK.example") == ADDR
+assert calls.count("ok.example") == 1
+print("   ✓ Miss then hit: 1 resolver call")
+
+# 2. TTL expiry
+now[0] = 11
+cache.lookup("ok.example")
+assert calls.count("ok.example") == 2
+print("   ✓ Entry re-resolved after TTL")
+
+# 3. Negative caching of non-existent hosts
+assert not cache.is_alive("https://dead.example/jobs")
+assert not cache.is_alive("https://dead.example/careers")
+assert calls.count("dead.example") == 1
+now[0] = 17
+assert not cache.is_alive("https://dead.example")
+assert calls.count("dead.example") == 2
+print("   ✓ Dead host cached for negative TTL, then retried")
+
+# 4. Temporary failures are not cached and keep their errno
+assert cache.is_alive("https://flaky.example")
+try:
+    cache.lookup("flaky.example")
+    raise AssertionError("expected gaierror")
+except socket.gaierror as e:
+    assert e.errno == socket.EAI_AGAIN
+assert calls.count("flaky.example") == 2
+print("   ✓ EAI_AGAIN not cached, errno preserved")
+
+# 5. URLs without a host
+assert not cache.is_alive("https:///jobs")
+print("   ✓ URL without host reported as dead")
+
+# 6. Concurrent lookups share one resolver call
+errors = []
+
+def worker():
+    try:
+        cache.lookup("shared.example")
+    except Exception as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=worker) for _ in range(5)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+assert not errors, errors
+assert calls.count("shared.example") == 1, calls.count("shared.example")
+print("   ✓ 5 concurrent lookups, 1 resolver call")
+
+# 7. Proxied URLs are left to the proxy
+scraper.uses_proxy = real_uses_proxy
+saved = {k: os.environ.pop(k) for k in list(os.environ) if k.lower() in ("no_proxy", "https_proxy", "all_proxy")}
+os.environ["HTTPS_PROXY"] = "http://127.0.0.1:9"
+try:
+    before = len(calls)
+    assert scraper.uses_proxy("https://dead.example/")
+    assert cache.is_alive("https://dead.example/") and len(calls) == before
+finally:
+    del os.environ["HTTPS_PROXY"]
+    os.environ.update(saved)
+print("   ✓ Proxied URL reported alive without a DNS lookup")
+
+print("\n" + "="*60)
+print("✅ DNS CACHE VERIFICATION COMPLETE")
+print("="*60)